@@ -1014,6 +1014,10 @@ class ArloBackEnd(object):
             return False
         return True
 
+    def _notify_batch(self, base, bodies):
+        for body in bodies:
+            self._notify(base, body=body)
+
     def _notify(self, base, body, trans_id=None):
         if trans_id is None:
             trans_id = self.gen_trans_id()
@@ -1111,6 +1115,38 @@ class ArloBackEnd(object):
             self.vdebug("notify+ sent")
             self._arlo.bg.run(self._notify, base=base, body=body)
 
+    def notify_batch(self, base, bodies, timeout=None, wait_for=None):
+        """Send several notifications to one base station in a single submission.
+
+        This behaves like repeated calls to `notify` but submits the whole batch
+        together: in asynchronous mode it queues one background job for all the
+        bodies so the posts go back-to-back down the session's keep-alive
+        connection, and in synchronous mode it starts every transaction before
+        waiting on any of them so the event waits overlap instead of
+        serializing.
+
+        :param base: base station to use
+        :param bodies: list of notification messages
+        :param timeout: how long to wait for responses before failing, only applied if `wait_for` is `event`.
+        :param wait_for: what to wait for, either `None`, `event`, `response` or `nothing`.
+        :return: a list with one response or event packet per body, or `None` when not waiting
+        """
+        if wait_for is None:
+            wait_for = "event" if self._arlo.cfg.synchronous_mode else "nothing"
+
+        if wait_for == "event":
+            self.vdebug("notify-batch+event running")
+            tids = [self._start_transaction() for _ in bodies]
+            for tid, body in zip(tids, bodies):
+                self._notify(base, body=body, trans_id=tid)
+            return [self._wait_for_transaction(tid, timeout) for tid in tids]
+        elif wait_for == "response":
+            self.vdebug("notify-batch+response running")
+            return [self._notify(base, body=body) for body in bodies]
+        else:
+            self.vdebug("notify-batch sent")
+            self._arlo.bg.run(self._notify_batch, base=base, bodies=bodies)
+
     def get(
         self,
         path,
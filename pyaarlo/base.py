@@ -1,5 +1,6 @@
 import pprint
 import time
+import traceback
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -444,13 +445,15 @@ class ArloBase(ArloDevice):
         # Only do work on 'old' style base stations
         if self.device_type == 'basestation' or self.device_type == 'arlobridge':
             self.debug("updating state")
-            self._arlo.be.notify(
+            self._arlo.be.notify_batch(
                 base=self,
-                body={
-                    "action": "get",
-                    "resource": "devices",
-                    "publishResponse": False,
-                },
+                bodies=[
+                    {
+                        "action": "get",
+                        "resource": "devices",
+                        "publishResponse": False,
+                    },
+                ],
                 wait_for="response",
             )
 
@@ -536,8 +539,18 @@ class ArloBase(ArloDevice):
         else:
             self._save_and_do_callbacks(CONNECTION_KEY, "available")
 
+    def _ping_job(self):
+        # the pool drops the returned future, so log failures here the way
+        # the background worker does for its jobs
+        try:
+            self._ping_and_check_reply()
+        except Exception as e:
+            self._arlo.error(
+                "ping-error={}\n{}".format(type(e).__name__, traceback.format_exc())
+            )
+
     def ping(self):
-        self._arlo.bg.run(self._ping_and_check_reply)
+        self._arlo.pool.submit(self._ping_job)
 
     @property
     def state(self):
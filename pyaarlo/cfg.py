@@ -104,6 +104,10 @@ class ArloCfg(object):
     def request_timeout(self):
         return self._kw.get("request_timeout", 60)
 
+    @property
+    def http_connections(self):
+        return self._kw.get("http_connections", 5)
+
     @property
     def stream_timeout(self):
         return self._kw.get("stream_timeout", 0)
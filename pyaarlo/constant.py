@@ -1,3 +1,5 @@
+import base64
+
 DEFAULT_HOST = "https://myapi.arlo.com"
 
 ORIGIN_HOST = "https://my.arlo.com"
@@ -256,6 +258,7 @@ BLANK_IMAGE = (
     "QIECBSJQoECBCBQoUCACBQoUiECBAgUiUKBAgQgUKFAgAgUKFIhAgQIFIlCgQIEIFChQoECBAgV+"
     "tivOs6f/QsrFAAAAAElFTkSuQmCC"
 )
+BLANK_IMAGE_BYTES = base64.standard_b64decode(BLANK_IMAGE)
 
 VIDEO_CONTENT_TYPES = ['2k', '4k', 'hd']
 
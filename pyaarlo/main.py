@@ -2,18 +2,17 @@
 #
 
 import base64
-import io
 import logging
 import os
 import pickle
 import pprint
+import re
+import struct
+import subprocess
 import sys
 
 import click
 
-from . import PyArlo
-from .util import to_b64
-
 logging.basicConfig(level=logging.ERROR,
                     format='%(asctime)s:%(name)s:%(levelname)s: %(message)s')
 _LOGGER = logging.getLogger('pyaarlo')
@@ -55,6 +54,10 @@ _out = None
 # Arlo instance...
 _arlo = None
 
+# compiled anonymizer, built once per run since the device list is fixed
+_anon_pattern = None
+_anon_valuables = None
+
 
 def _debug(args):
     _LOGGER.debug("{}".format(args))
@@ -76,15 +79,15 @@ def _fatal(args):
 def _print_start():
     if opts['anonymize'] or opts['encrypt']:
         global _out
-        _out = io.StringIO()
+        _out = []
 
 
 def _print(msg):
     if _out is None:
         print("{}".format(msg))
     else:
-        _out.write(msg)
-        _out.write("\n")
+        _out.append(msg)
+        _out.append("\n")
 
 
 def _pprint(msg, obj):
@@ -93,8 +96,7 @@ def _pprint(msg, obj):
 
 def _print_end():
     if _out is not None:
-        _out.seek(0, 0)
-        out_text = _out.read()
+        out_text = "".join(_out)
 
         if opts['anonymize']:
             out_text = anonymize_from_string(out_text)
@@ -119,13 +121,12 @@ def encrypt_to_string(obj):
     from Crypto.Cipher import PKCS1_OAEP
 
     try:
-        # pickle and resize object
-        obj = pickle.dumps(obj)
-        obj += b' ' * (16 - len(obj) % 16)
+        # pickle object; GCM is a stream mode so no padding needed
+        obj = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
 
         # create key and encrypt pickled object with it
         key = get_random_bytes(16)
-        aes_cipher = AES.new(key, AES.MODE_EAX)
+        aes_cipher = AES.new(key, AES.MODE_GCM)
         obj, tag = aes_cipher.encrypt_and_digest(obj)
         nonce = aes_cipher.nonce
 
@@ -138,8 +139,9 @@ def encrypt_to_string(obj):
         rsa_cipher = PKCS1_OAEP.new(rsa_cipher)
         key = rsa_cipher.encrypt(key)
 
-        # create key/object dictionary, pickle and base64 encode
-        key_obj = pickle.dumps({'k': key, 'n': nonce, 'o': obj, 't': tag})
+        # flat envelope - key length, wrapped key, nonce, tag, ciphertext -
+        # then base64 encode; no pickle framing around untrusted data
+        key_obj = struct.pack(">H", len(key)) + key + nonce + tag + obj
         return base64.encodebytes(key_obj).decode().rstrip()
     except ValueError as err:
         _fatal("encrypt error: {}".format(err))
@@ -153,19 +155,28 @@ def decrypt_from_string(key_obj):
     from Crypto.Cipher import PKCS1_OAEP
 
     try:
-        # decode key/object dictionary then unpickle it
+        # split the flat envelope back up; nonce and tag are the GCM
+        # default 16 bytes each
         key_obj = base64.b64decode(key_obj)
-        key_obj = pickle.loads(key_obj)
-
-        # import private key and decrypt nonce
+        (key_len,) = struct.unpack_from(">H", key_obj)
+        offset = 2
+        enc_key = key_obj[offset:offset + key_len]
+        offset += key_len
+        nonce = key_obj[offset:offset + 16]
+        offset += 16
+        tag = key_obj[offset:offset + 16]
+        offset += 16
+        obj = key_obj[offset:]
+
+        # import private key and decrypt session key
         key = open(opts["private-key"], "r").read()
         rsa_cipher = RSA.importKey(key, passphrase=opts["pass-phrase"])
         rsa_cipher = PKCS1_OAEP.new(rsa_cipher)
-        key = rsa_cipher.decrypt(key_obj["k"])
+        key = rsa_cipher.decrypt(enc_key)
 
-        # decrypt object and unpickle
-        aes_cipher = AES.new(key, AES.MODE_EAX, nonce=key_obj['n'])
-        obj = aes_cipher.decrypt_and_verify(key_obj['o'], key_obj['t'])
+        # decrypt object, then unpickle only once the tag has verified
+        aes_cipher = AES.new(key, AES.MODE_GCM, nonce=nonce)
+        obj = aes_cipher.decrypt_and_verify(obj, tag)
         obj = pickle.loads(obj)
         return obj
     except ValueError as err:
@@ -174,7 +185,17 @@ def decrypt_from_string(key_obj):
         _fatal("unexpected decrypt error: {}".format(sys.exc_info()[0]))
 
 
-def anonymize_from_string(obj):
+def _build_anonymizer():
+    """Collect the ids to mask and compile the substitution pattern.
+
+    The device list and credentials are fixed for the life of a CLI run so
+    this only needs to happen once, however many strings get anonymized.
+    """
+    # deferred because util drags in requests
+    from .util import to_b64
+
+    global _anon_pattern, _anon_valuables
+
     # get device list
     keys = ['deviceId', 'uniqueId', 'userId', 'xCloudId']
     valuables = {}
@@ -191,13 +212,27 @@ def anonymize_from_string(obj):
     if opts["password"] is not None:
         valuables[to_b64(opts["password"])] = "PASSWORD"
 
-    anon = obj
-    for valuable in valuables:
-        anon = anon.replace(valuable, valuables[valuable])
-    return anon
+    _anon_valuables = valuables
+    if valuables:
+        # one alternation scan instead of a full-string replace per valuable;
+        # longest first so ids that prefix other ids still match whole
+        _anon_pattern = re.compile(
+            "|".join(re.escape(valuable) for valuable in sorted(valuables, key=len, reverse=True))
+        )
+
+
+def anonymize_from_string(obj):
+    if _anon_valuables is None:
+        _build_anonymizer()
+    if _anon_pattern is None:
+        return obj
+    return _anon_pattern.sub(lambda match: _anon_valuables[match.group(0)], obj)
 
 
 def login():
+    # deferred so commands that never log in don't pay the full import bill
+    from . import PyArlo
+
     _info("logging in")
     if opts["username"] is None or opts["password"] is None:
         _fatal("please supply a username and password")
@@ -213,10 +248,13 @@ def login():
     return _arlo
 
 
-def print_item(_name, item):
-    if opts["compact"]:
-        _print(" {};did={};mid={}/{};sno={}".format(item.name, item.device_id, item.model_id, item.hw_version,
-                                                    item.serial_number))
+_COMPACT_ITEM = " {};did={};mid={}/{};sno={}"
+
+
+def print_item(_name, item, compact=False):
+    if compact:
+        _print(_COMPACT_ITEM.format(item.name, item.device_id, item.model_id, item.hw_version,
+                                    item.serial_number))
     else:
         _print(" {}".format(item.name))
         _print("  device-id:{}".format(item.device_id))
@@ -227,8 +265,9 @@ def print_item(_name, item):
 def list_items(name, items):
     _print("{}:".format(name))
     if items is not None:
+        compact = opts["compact"]
         for item in items:
-            print_item(name, item)
+            print_item(name, item, compact)
 
 
 # list [all|cameras|bases]
@@ -388,10 +427,12 @@ def camera(name, device_id, start_ffmpeg, action):
 
         if start_ffmpeg:
             print('starting ffmpeg')
-            os.system("mkdir video_dir")
-            os.system("ffmpeg -i '{}' ".format(stream_url) +
-                      "-fflags flush_packets -max_delay 2 -flags -global_header " +
-                      "-hls_time 2 -hls_list_size 3 -vcodec copy -y video_dir/video.m3u8")
+            os.makedirs("video_dir", exist_ok=True)
+            subprocess.run(["ffmpeg", "-i", stream_url,
+                            "-fflags", "flush_packets", "-max_delay", "2",
+                            "-flags", "-global_header",
+                            "-hls_time", "2", "-hls_list_size", "3",
+                            "-vcodec", "copy", "-y", "video_dir/video.m3u8"])
 
     elif action == 'stop-stream':
         pass
@@ -10,6 +10,7 @@ class ArloStorage(object):
         self._state_file = self._arlo.cfg.state_file
         self.db = {}
         self.lock = threading.Lock()
+        self._dirty = False
         self.load()
 
     def _ekey(self, key):
@@ -36,11 +37,17 @@ class ArloStorage(object):
         if self._state_file is not None:
             try:
                 with self.lock:
+                    if not self._dirty:
+                        return
                     with open(self._state_file, "wb") as dump:
-                        pickle.dump(self.db, dump)
+                        pickle.dump(self.db, dump, protocol=pickle.HIGHEST_PROTOCOL)
+                    self._dirty = False
             except Exception:
                 self._arlo.warning("storage: file not written")
 
+    def has_dirty(self):
+        return self._dirty
+
     def file_name(self):
         return self._state_file
 
@@ -66,15 +73,18 @@ class ArloStorage(object):
         self._arlo.debug(f"{prefix}: {output[:80]}")
         with self.lock:
             self.db[ekey] = value
+            self._dirty = True
             return value
 
     def unset(self, key):
         with self.lock:
             del self.db[self._ekey(key)]
+            self._dirty = True
 
     def clear(self):
         with self.lock:
             self.db = {}
+            self._dirty = True
 
     def dump(self):
         with self.lock: